@@ -29,8 +29,14 @@ THEME_MAP = {
 DEFAULT_USER = os.getenv('DEFAULT_USER')
 DEFAULT_PASSWORD = os.getenv('DEFAULT_PASSWORD')
 
+# Constants for password hashing (PBKDF2-HMAC-SHA256)
+PASSWORD_HASH_PREFIX = 'pbkdf2$'
+PASSWORD_HASH_ITERATIONS = 200_000
+
+# Seconds for which preferences read from the database are reused
+PREFERENCES_CACHE_TTL = 30
+
 # Constants for regular expressions
 REGEX_PATTERNS = {
-    'password': r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*()]).{8,}$',
-    'email': r"[^@]+@[^@]+\.[^@]+"
+    'password': r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*()]).{8,}$'
 }
@@ -5,21 +5,32 @@ This includes common tasks such as logging setup, date formatting, and other hel
 import re
 import sqlite3
 import os
+import hmac
 import hashlib
 import logging
 from PyQt6.QtCore import QDateTime
-from PyQt6.QtWidgets import QMessageBox
-from plyer import notification
-from helpers.constants import APP_NAME, REGEX_PATTERNS
+from helpers.constants import APP_NAME, REGEX_PATTERNS, PASSWORD_HASH_PREFIX, PASSWORD_HASH_ITERATIONS
+
+# Validation patterns, compiled once when the module is loaded
+_PASSWORD_RE = re.compile(REGEX_PATTERNS['password'])
+
+# Message boxes reused by show_dialog, one per icon
+_message_boxes = {}
 
 def setup_logging(level=logging.DEBUG, filename='app.log', handler=logging.FileHandler):
     """
     Set up the logging configuration for the application.
 
+    Several modules call this when they are imported; only the first call configures logging.
+
     Args:
         level: The logging level (e.g., DEBUG, INFO).
         filename: The name of the file where logs will be stored.
     """
+    # basicConfig ignores later calls anyway, so do not open another log file for them
+    if logging.getLogger().handlers:
+        return
+
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     log_handler = handler(filename)
     log_handler.setLevel(level)
@@ -50,24 +61,78 @@ def get_db_connection(db_file):
         raise
 
 
-def hash_password(password, salt=None):
+def hash_password(password, salt=None, iterations=PASSWORD_HASH_ITERATIONS):
     """
-    Hash a password using SHA-256.
+    Hash a password using PBKDF2-HMAC-SHA256.
+
+    The hash is stored as 'pbkdf2$<iterations>$<hex digest>', so it can be told apart from
+    hashes created by the former single-pass SHA-256 scheme and still verifies after
+    PASSWORD_HASH_ITERATIONS is raised.
 
     Args:
         password: The password to hash.
         salt: An optional salt for hashing. If not provided, a new salt is generated.
+        iterations: The number of PBKDF2 iterations. Defaults to PASSWORD_HASH_ITERATIONS.
 
     Returns:
         A tuple of the hashed password and the used salt.
     """
     if salt is None:
-        salt = hashlib.sha256(os.urandom(32)).hexdigest()
-    password_bytes = password.encode('utf-8')
-    salt_bytes = salt.encode('utf-8')
-    password_salt = password_bytes + salt_bytes
-    hashed_password = hashlib.sha256(password_salt).hexdigest()
-    return hashed_password, salt
+        salt = os.urandom(16).hex()
+    hashed_password = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), iterations)
+    return f"{PASSWORD_HASH_PREFIX}{iterations}${hashed_password.hex()}", salt
+
+
+def hash_password_legacy(password, salt):
+    """
+    Hash a password using the former single-pass SHA-256 scheme.
+
+    Only used to verify passwords stored before PBKDF2 hashing was introduced.
+
+    Args:
+        password: The password to hash.
+        salt: The salt stored with the password.
+
+    Returns:
+        The hashed password.
+    """
+    return hashlib.sha256(password.encode('utf-8') + salt.encode('utf-8')).hexdigest()
+
+
+def verify_password(password, stored_hashed_password, salt):
+    """
+    Check a password against a stored hash, whichever scheme created it.
+
+    Args:
+        password: The password to check.
+        stored_hashed_password: The hash stored for the user.
+        salt: The salt stored with the hash.
+
+    Returns:
+        True if the password matches, False otherwise.
+    """
+    if stored_hashed_password.startswith(PASSWORD_HASH_PREFIX):
+        # Hash with the iteration count the stored password was created with
+        iterations, _, _ = stored_hashed_password[len(PASSWORD_HASH_PREFIX):].partition('$')
+        if not iterations.isdigit():
+            return False
+        hashed_password, _ = hash_password(password, salt, int(iterations))
+    else:
+        hashed_password = hash_password_legacy(password, salt)
+    return hmac.compare_digest(hashed_password, stored_hashed_password)
+
+
+def is_legacy_password_hash(stored_hashed_password):
+    """
+    Check whether a stored hash was created by the former SHA-256 scheme.
+
+    Args:
+        stored_hashed_password: The hash stored for the user.
+
+    Returns:
+        True if the hash should be upgraded, False otherwise.
+    """
+    return not stored_hashed_password.startswith(PASSWORD_HASH_PREFIX)
 
 
 def is_valid_username(username):
@@ -106,10 +171,7 @@ def is_valid_password(password):
     Returns:
         True if the password meets the criteria, False otherwise.
     """
-    # Centralized configuration for regular expressions
-    pattern = re.compile(REGEX_PATTERNS['password'])
-    valid = bool(pattern.match(password))
-    if not valid:
+    if _PASSWORD_RE.match(password) is None:
         return False, "Password must contain at least one uppercase, one lowercase, one number, one special character, and be at least 8 characters long."
     return True, ""
 
@@ -124,8 +186,10 @@ def is_valid_email(email):
     Returns:
         True if the email is in a proper format, False otherwise.
     """
-    pattern = re.compile(REGEX_PATTERNS['email'])
-    return bool(pattern.match(email)), "Invalid email format."
+    # A non-empty local part, a single '@', and a domain with a '.' that has characters on both sides
+    local_part, at, domain = email.partition('@')
+    valid = bool(local_part) and bool(at) and '@' not in domain and '.' in domain[1:-1]
+    return valid, "Invalid email format."
 
 
 def get_env_variable(var_name, default=None):
@@ -169,23 +233,38 @@ def parse_datetime(date_time_str, format="%Y-%m-%d %H:%M:%S"):
     """
     return QDateTime.fromString(date_time_str, format)
 
-def show_dialog(title, message, icon=QMessageBox.Icon.Information):
+def show_dialog(title, message, icon=None):
     """
     Display a general message box.
 
     Args:
         title: The title of the message box.
         message: The message to display.
-        icon: QMessageBox.Icon.Critical or QMessageBox.Icon.Information
+        icon: QMessageBox.Icon.Critical or QMessageBox.Icon.Information (the default)
     """
-    msg = QMessageBox()
-    msg.setIcon(icon)
+    # Imported here so the non-GUI helpers in this module can be used without loading QtWidgets
+    from PyQt6.QtWidgets import QApplication, QMessageBox
+
+    if icon is None:
+        icon = QMessageBox.Icon.Information
+
+    # Reuse the box for this icon unless it is already on screen (a dialog opened from another dialog).
+    # Boxes are only cached while an application exists, and dropped when it quits so none outlive it.
+    app = QApplication.instance()
+    msg = _message_boxes.get(icon) if app is not None else None
+    if msg is None or msg.isVisible():
+        msg = QMessageBox()
+        msg.setIcon(icon)
+        if app is not None:
+            if not _message_boxes:
+                app.aboutToQuit.connect(_message_boxes.clear)
+            _message_boxes.setdefault(icon, msg)
     msg.setWindowTitle(title)
     msg.setText(message)
     msg.exec()
 
 
-def send_windows_notification(title: str, message: str, task_manager, user_id, timeout: int = 10, app_name: str = APP_NAME) -> bool:
+def send_windows_notification(title: str, message: str, task_manager, user_id, timeout: int = 10, app_name: str = APP_NAME, check_preferences: bool = True) -> bool:
     """
     Send a Windows notification if the user has enabled notifications.
 
@@ -193,17 +272,20 @@ def send_windows_notification(title: str, message: str, task_manager, user_id, t
         title: The title of the notification.
         message: The message content of the notification.
         task_manager: Instance of TaskManager to retrieve user preferences.
+        user_id: The ID of the user whose preferences apply.
         timeout: The time in seconds for the notification to disappear.
         app_name: The name of application.
+        check_preferences: Whether to check that the user has notifications enabled.
+            Callers that already checked the preferences pass False to skip the lookup.
 
     Returns:
         True if the notification was sent successfully, False otherwise.
     """
     try:
-        preferences = task_manager.get_preferences(user_id)
-        enable_notifications = preferences.get('enable_notifications', 'True') == 'True'
+        if not check_preferences or task_manager.notifications_enabled(user_id):
+            # Imported here so only code paths that actually notify load plyer and its platform backend
+            from plyer import notification
 
-        if enable_notifications:
             notification.notify(title=title,message=message,app_name=app_name,timeout=timeout)
             logging.info(f"Sent Windows notification: Title='{title}', Message='{message}', Timeout={timeout}, App Name='{app_name}'")
             return True
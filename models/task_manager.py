@@ -2,11 +2,13 @@ import os
 import re
 import csv
 import sqlite3
+import time
 from PyQt6.QtCore import QDateTime
 import datetime
 import logging
-from helpers.utils import setup_logging, get_env_variable, is_valid_email, is_valid_username, is_valid_password, is_valid_task_name, hash_password, format_datetime
-from helpers.constants import DATABASE_FILE, DEFAULT_PRIORITIES, DEFAULT_CATEGORIES, STATUS_ACTIVE, STATUS_INACTIVE, STATUS_COMPLETED
+from itertools import islice
+from helpers.utils import setup_logging, get_env_variable, is_valid_email, is_valid_username, is_valid_password, is_valid_task_name, hash_password, verify_password, is_legacy_password_hash, format_datetime
+from helpers.constants import DATABASE_FILE, DEFAULT_PRIORITIES, DEFAULT_CATEGORIES, STATUS_ACTIVE, STATUS_INACTIVE, STATUS_COMPLETED, PREFERENCES_CACHE_TTL
 
 # Initialize logging configuration at application startup
 setup_logging()
@@ -21,6 +23,16 @@ class TaskManager:
         Validates required environment variables.
         """
         self.db_file = db_file
+
+        # Bumped whenever tasks are written, so callers can tell whether data derived from them is stale
+        self.tasks_version = 0
+
+        # Preferences per user as {user_id: (expiry time, preferences)}
+        self._prefs_cache = {}
+
+        # WAL mode is stored in the database file, so it only needs to be switched on once
+        self._wal_enabled = False
+
         self.setup_database()
         self.validate_environment_variables()
 
@@ -28,11 +40,26 @@ class TaskManager:
         """
         Establishes and returns a database connection.
 
+        The database uses write-ahead logging with synchronous=NORMAL, so commits append to
+        the log instead of syncing the main file each time.
+
         Returns:
             A connection object to the SQLite database.
         """
         try:
-            return sqlite3.connect(self.db_file)
+            conn = sqlite3.connect(self.db_file)
+            try:
+                if not self._wal_enabled:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    self._wal_enabled = True
+                # These settings only last for the connection
+                conn.execute('PRAGMA synchronous=NORMAL')
+                conn.execute('PRAGMA temp_store=MEMORY')
+            except sqlite3.Error:
+                # Don't leave the connection open when it cannot be configured
+                conn.close()
+                raise
+            return conn
         except sqlite3.Error as e:
             # Handles database-specific errors with logging for troubleshooting
             logging.error(f"Database connection error: {e}")
@@ -426,9 +453,12 @@ class TaskManager:
                 cursor.execute("SELECT id, password, salt FROM users WHERE username = ?", (username,))
                 if stored_data := cursor.fetchone():
                     user_id, stored_hashed_password, salt = stored_data
-                    hashed_password, _ = hash_password(password, salt)
 
-                    if stored_hashed_password == hashed_password:
+                    if verify_password(password, stored_hashed_password, salt):
+                        # Upgrade a password stored with the former SHA-256 scheme now that it is known
+                        if is_legacy_password_hash(stored_hashed_password):
+                            hashed_password, salt = hash_password(password)
+                            cursor.execute("UPDATE users SET password = ?, salt = ? WHERE id = ?", (hashed_password, salt, user_id))
                         return True, user_id
                 return False, None
 
@@ -561,6 +591,7 @@ class TaskManager:
                     (user_id, task_name, due_date, priority,category, created_at, STATUS_ACTIVE)
                 )
                 task_id = cursor.lastrowid
+            self.tasks_version += 1
             return None, task_id
         except sqlite3.Error as e:
             return str(e), None
@@ -586,6 +617,7 @@ class TaskManager:
         except sqlite3.Error as e:
             logging.error(f"Database error while updating task: {e}")
             return "Failed to update task."
+        self.tasks_version += 1
         return None  # Indicates successful update
 
     def get_task_details(self, task_id):
@@ -609,7 +641,8 @@ class TaskManager:
 
     def list_tasks(self, user_id, status=None):
         """
-        Lists tasks along with priority color based on their status and user ID.
+        Lists tasks along with priority color based on their status and user ID,
+        ordered by due date with the most recent first.
 
         Args:
             user_id: The ID of the user.
@@ -630,6 +663,7 @@ class TaskManager:
                     FROM tasks t
                     LEFT JOIN priorities p ON t.priority = p.name AND t.user_id = p.user_id
                     WHERE t.user_id = ? AND t.status IN (?, ?)
+                    ORDER BY t.due_date DESC
                     '''
                     cursor.execute(query, (user_id, *status_tuple))
                 else:
@@ -638,6 +672,7 @@ class TaskManager:
                     FROM tasks t
                     LEFT JOIN priorities p ON t.priority = p.name AND t.user_id = p.user_id
                     WHERE t.user_id = ? AND t.status = ?
+                    ORDER BY t.due_date DESC
                     '''
                     cursor.execute(query, (user_id, status))
 
@@ -649,27 +684,57 @@ class TaskManager:
             logging.error(f"An error occurred: {e}")
             return []
 
+    def iter_tasks_for_print(self, user_id, batch_size=256):
+        """
+        Streams only the columns of the printable task report for a user, a batch of rows at a time.
+
+        Args:
+            user_id: The ID of the user.
+            batch_size: The maximum number of rows fetched from the cursor at once.
+
+        Yields:
+            Lists of (name, due_date, priority, category) tuples for active and completed tasks,
+            ordered by due date with the most recent first, like the task list.
+            Nothing more is yielded after a database error.
+        """
+        try:
+            with self.get_db_connection() as conn:
+                cursor = conn.execute(
+                    'SELECT name, due_date, priority, category FROM tasks WHERE user_id = ? AND status IN (?, ?) ORDER BY due_date DESC',
+                    (user_id, STATUS_ACTIVE, STATUS_COMPLETED)
+                )
+                while batch := cursor.fetchmany(batch_size):
+                    yield batch
+        except sqlite3.DatabaseError as e:
+            logging.error(f"Database error: {e}")
+
     def remove_tasks(self, task_ids):
         """
-        Sets a task's status to inactive, effectively removing it from active listings.
+        Sets the status of several tasks to inactive, effectively removing them from active listings.
+
+        All the tasks are updated by a single statement in one transaction.
 
         Args:
-            task_id: The unique identifier of the task to be removed.
+            task_ids: The unique identifiers of the tasks to be removed. Duplicates are ignored.
 
         Returns:
             None if successful, an error message otherwise.
         """
+        task_ids = list(dict.fromkeys(task_ids))
+        if not task_ids:
+            return None
+
         try:
             with self.get_db_connection() as conn:
-                cursor = conn.cursor()
                 # Create a query string with the correct number of placeholders
                 placeholders = ', '.join(['?'] * len(task_ids))
                 query = f"UPDATE tasks SET status = {STATUS_INACTIVE} WHERE id IN ({placeholders})"
-                cursor.execute(query, task_ids)
-                conn.commit()
-            return "Tasks successfully set as inactive."
+                conn.execute(query, task_ids)
         except sqlite3.Error as e:
+            logging.error(f"Database error while removing tasks: {e}")
             return str(e)
+        self.tasks_version += 1
+        return None
 
     def search_tasks(self, user_id, text, match_case=False, whole_word=False, use_regex=False):
         """
@@ -685,37 +750,48 @@ class TaskManager:
         Returns:
             list: A list of tasks matching the search criteria.
         """
+        # Whole-word matches go through the REGEXP path so word boundaries also hold at punctuation
+        compiled = None
+        if use_regex or whole_word:
+            mode = 'regex'
+            pattern = text if use_regex else rf"\b{re.escape(text)}\b"
+
+            # Compile the pattern once for the whole search rather than once per row
+            try:
+                compiled = re.compile(pattern, 0 if match_case else re.IGNORECASE)
+            except re.error as e:
+                logging.error(f"Invalid search pattern: {e}")
+                return []
+        elif match_case:
+            # LIKE ignores case whatever the collation, while instr compares exactly
+            mode = 'exact'
+            pattern = text
+        else:
+            mode = 'like'
+            # Escape LIKE wildcards so '%' and '_' in the text match literally, as in the other modes
+            escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            pattern = f"%{escaped}%"
+
+        # A single statement covers every search mode, so its text never changes between searches
+        query = '''
+            SELECT t.id, t.name, t.due_date, t.priority, t.category, t.status, p.color
+            FROM tasks t
+            LEFT JOIN priorities p ON t.priority = p.name AND t.user_id = p.user_id
+            WHERE t.user_id = :user_id AND t.status IN (1, 2)
+            AND CASE :mode
+                WHEN 'regex' THEN t.name REGEXP :pattern
+                WHEN 'exact' THEN instr(t.name, :pattern) > 0
+                ELSE t.name LIKE :pattern ESCAPE '\\'
+            END
+            ORDER BY t.due_date DESC
+        '''
+        parameters = {'user_id': user_id, 'mode': mode, 'pattern': pattern}
+
         with self.get_db_connection() as conn:
-            # Define a REGEXP function for regex searches
-            if use_regex:
-                def regexp(expr, item):
-                    reg = re.compile(expr, re.IGNORECASE if not match_case else 0)
-                    return reg.search(item) is not None
-                conn.create_function("REGEXP", 2, regexp)
-                query = '''
-                    SELECT t.id, t.name, t.due_date, t.priority, t.category, t.status, p.color
-                    FROM tasks t
-                    LEFT JOIN priorities p ON t.priority = p.name AND t.user_id = p.user_id
-                    WHERE t.user_id = ? AND t.name REGEXP ? AND t.status IN (1, 2)
-                '''
-                parameters = [user_id, text]
-            else:
-                like_clause = f"%{text}%"
-                case_clause = "COLLATE RTRIM" if match_case else ""
-                whole_word_clause = (
-                    "(t.name LIKE ? OR t.name LIKE ? OR t.name LIKE ? OR t.name = ?)"
-                    if whole_word
-                    else "t.name LIKE ?"
-                )
-                query = f'''
-                    SELECT t.id, t.name, t.due_date, t.priority, t.category, t.status, p.color
-                    FROM tasks t
-                    LEFT JOIN priorities p ON t.priority = p.name AND t.user_id = p.user_id
-                    WHERE t.user_id = ? AND {whole_word_clause} AND t.status IN (1, 2)
-                    {case_clause}
-                '''
-                parameters = [user_id, like_clause, f"{text} %", f"% {text}", f"% {text} %", text] if whole_word else [
-                    user_id, like_clause]
+            # The statement names REGEXP in every mode, so the function must always be registered
+            def regexp(_expr, item, _compiled=compiled):
+                return _compiled.search(item) is not None if item else False
+            conn.create_function("REGEXP", 2, regexp, deterministic=True)
 
             try:
                 cursor = conn.cursor()
@@ -741,18 +817,28 @@ class TaskManager:
         except sqlite3.Error:
             return None  # Return None if there's an error during the operation
 
-    def get_due_tasks(self):
+    def get_due_tasks(self, user_id=None):
         """
-        Retrieves tasks that are due on the current day and have a specific status.
+        Retrieves active tasks that are due on the current day.
+
+        Args:
+            user_id: The ID of the user whose tasks to retrieve. If None, tasks of all users are retrieved.
 
         Returns:
-            A list of task names due today and with the specified status,
-            an empty list in case of an error.
+            A list of (task ID, task name) tuples due today, an empty list in case of an error.
         """
         today = datetime.date.today().strftime("%Y-%m-%d")
+        query = "SELECT id, name FROM tasks WHERE due_date = ? AND status = ?"
+        parameters = [today, STATUS_ACTIVE]
+        if user_id is not None:
+            query += " AND user_id = ?"
+            parameters.append(user_id)
+
         try:
             with self.get_db_connection() as conn:
-                return self._extracted_from_get_due_tasks_12(conn, today)
+                tasks = conn.execute(query, parameters).fetchall()
+            logging.info(f"Tasks due today: {tasks}")
+            return tasks
         except sqlite3.DatabaseError as e:
             logging.error(f"Database error: {e}")
             return []
@@ -760,80 +846,91 @@ class TaskManager:
             logging.error(f"An error occurred: {e}")
             return []
 
-    # TODO Rename this here and in `get_due_tasks`
-    def _extracted_from_get_due_tasks_12(self, conn, today):
-        cursor = conn.cursor()
-        query = "SELECT name FROM tasks WHERE due_date = ? AND status = ?"
-        cursor.execute(query, (today, STATUS_ACTIVE)) # '1' is the value indicating an active task
-        tasks = [row[0] for row in cursor.fetchall()] # Fetch all rows and extract the task names
-        logging.info(f"Tasks due today: {tasks}")
-        return tasks
-
-    def export_tasks(self, file_path, user_id):
+    def export_tasks(self, file_path, user_id, chunk_size=10_000):
         """
         Exports active tasks to a CSV file.
 
         Args:
             file_path: The file path where the tasks should be exported.
+            user_id: The ID of the user whose tasks are exported.
+            chunk_size: The number of rows fetched from the database and written at once.
 
         Returns:
             A success message if the export is successful, an error message otherwise.
         """
         try:
-            with self.get_db_connection() as conn:
+            # Stream rows from the cursor in chunks into a block-buffered CSV writer
+            with self.get_db_connection() as conn, open(file_path, mode='w', newline='', encoding='utf-8', buffering=1 << 20) as file:
                 cursor = conn.cursor()
                 cursor.execute(
                     'SELECT name, due_date, priority, category, created_at FROM tasks WHERE user_id = ? AND status IN (1, 2)', (user_id,))
-                tasks = cursor.fetchall()
-
-            with open(file_path, mode='w', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
                 writer.writerow(['Name', 'Due Date', 'Priority', 'Category', 'Created At'])
-                for task in tasks:
-                    writer.writerow(task)
+                while rows := cursor.fetchmany(chunk_size):
+                    writer.writerows(rows)
 
             return "Tasks exported successfully."
         except Exception as e:
             return f"Error exporting tasks: {e}"  # Return error message in case of failure
 
-    def import_tasks(self, file_name, user_id):
+    def import_tasks(self, file_name, user_id, chunk_size=10_000):
         """
         Imports tasks from a CSV file into the database.
 
         Args:
             file_name: The path to the CSV file containing tasks.
+            user_id: The ID of the user importing the tasks.
+            chunk_size: The number of rows read from the file and inserted at once.
 
         Returns:
             A success message if the import is successful, an error message otherwise.
         """
         try:
-            with open(file_name, mode='r') as file:
+            created_at = QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
+            with open(file_name, mode='r', newline='', encoding='utf-8', buffering=1 << 20) as file:
                 reader = csv.reader(file)
                 next(reader, None)  # Skip the header row
+                # Insert the rows chunk by chunk in a single transaction; an invalid row rolls the whole import back
+                rows = self._iter_import_rows(reader, user_id, created_at)
                 with self.get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    for row in reader:
-                        # Ensure each row has the required number of elements
-                        if len(row) >= 5:
-                            task_name, due_date, priority, category = row[:4]
-
-                            # Validate the task name
-                            if not is_valid_task_name(task_name):
-                                raise ValueError(f"Invalid task name: {task_name}")
-
-                            # Prepare other task details and insert into the database
-                            created_at = QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
-                            cursor.execute(
-                                "INSERT INTO tasks (user_id, name, due_date, priority, category, created_at, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                                (user_id, task_name, due_date, priority,category, created_at, STATUS_ACTIVE)
-                            )
-                        else:
-                            logging.error(f"Skipping incomplete row: {row}")
+                    while chunk := list(islice(rows, chunk_size)):
+                        conn.executemany(
+                            "INSERT INTO tasks (user_id, name, due_date, priority, category, created_at, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            chunk
+                        )
+            self.tasks_version += 1
             return "Import successful"
         except Exception as e:
             # Error handling with detailed message
             return f"Import failed: {str(e)}"
 
+    def _iter_import_rows(self, reader, user_id, created_at):
+        """
+        Yields validated task rows from a CSV reader, ready to be inserted into the tasks table.
+
+        Args:
+            reader: The CSV reader positioned after the header row.
+            user_id: The ID of the user importing the tasks.
+            created_at: The creation timestamp shared by all imported tasks.
+
+        Raises:
+            ValueError: If a row contains an invalid task name.
+        """
+        # The csv reader already parses in C; keep the per-row Python work to unpacking and one check
+        is_valid = is_valid_task_name
+        for row in reader:
+            # Ensure each row has the required number of elements
+            if len(row) >= 5:
+                task_name, due_date, priority, category = row[0], row[1], row[2], row[3]
+
+                # Validate the task name
+                if not is_valid(task_name):
+                    raise ValueError(f"Invalid task name: {task_name}")
+
+                yield (user_id, task_name, due_date, priority, category, created_at, STATUS_ACTIVE)
+            else:
+                logging.error(f"Skipping incomplete row: {row}")
+
     def set_task_complete(self, task_id):
         """
         Sets the status of the task with the given ID to complete.
@@ -850,23 +947,59 @@ class TaskManager:
         except Exception as e:
             logging.error(f"Error setting task as complete: {e}")
             raise
+        self.tasks_version += 1
 
     def get_preferences(self, user_id):
         """
         Retrieves user preferences from the database.
 
+        Preferences are read on every notification, so they are cached for
+        PREFERENCES_CACHE_TTL seconds and dropped as soon as they are saved.
+
         Returns:
             A dictionary of preferences if successful, an empty dictionary otherwise.
         """
+        now = time.monotonic()
+        cached = self._prefs_cache.get(user_id)
+        if cached is not None and now < cached[0]:
+            return dict(cached[1])
+
         try:
             with self.get_db_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT key, value FROM preferences WHERE user_id = ?', (user_id,))
                 # Create a dictionary from the fetched preferences
-                return dict(cursor.fetchall())
+                preferences = dict(cursor.fetchall())
         except sqlite3.Error as e:
             return {}  # Returns an empty dictionary in case of an error
 
+        self._prefs_cache[user_id] = (now + PREFERENCES_CACHE_TTL, preferences)
+        return dict(preferences)
+
+    def notifications_enabled(self, user_id):
+        """
+        Tells whether a user has notifications enabled, based on the cached preferences.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            True unless the user turned notifications off.
+        """
+        return self.get_preferences(user_id).get('enable_notifications', 'True') == 'True'
+
+    def invalidate_prefs_cache(self, user_id=None):
+        """
+        Discards cached preferences so the next read goes to the database.
+
+        Args:
+            user_id: The ID of the user whose preferences to discard. If None, all cached preferences are discarded.
+        """
+        if user_id is None:
+            self._prefs_cache.clear()
+        else:
+            self._prefs_cache.pop(user_id, None)
+
     def save_preferences(self, user_id, preferences):
         """
         Save preferences to the database.
@@ -882,6 +1015,8 @@ class TaskManager:
         except sqlite3.Error as e:
             logging.error(f"Error saving preferences: {e}")
             return f"Failed to save preferences: {e}"
+        # Drop the cached preferences only once the new ones are committed, so a read in between cannot re-cache the old ones
+        self.invalidate_prefs_cache(user_id)
         return None  # Success
 
     def get_task_analytics(self, user_id):
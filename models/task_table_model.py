@@ -0,0 +1,141 @@
+"""
+task_table_model.py: Implements the table model behind the main window's task list.
+It keeps tasks as plain tuples and lets the view request only the cells it needs to paint.
+"""
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QFont, QIcon
+from helpers.constants import STATUS_COMPLETED
+
+# Item data roles looked up once, since data() runs for every role of every visible cell
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+_FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+_FONT_ROLE = Qt.ItemDataRole.FontRole
+_DECORATION_ROLE = Qt.ItemDataRole.DecorationRole
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    A table model exposing tasks as rows of name, due date, priority and category.
+
+    Each row is a tuple as returned by TaskManager.list_tasks:
+    (id, name, due_date, priority, category, status, color).
+    """
+
+    HEADERS = ("Task Name", "Due Date", "Priority", "Category")
+    PRIORITY_COLUMN = 2
+
+    def __init__(self, parent=None):
+        """
+        Initializes an empty task table model.
+
+        Parameters:
+            parent (QObject, optional): The parent object of the model.
+        """
+        super().__init__(parent)
+        self._rows = []
+
+        # Priority colors as {color string: QColor, or None if the string is not a valid color}
+        self._colors = {}
+
+        # Visual styles shared by every cell
+        self._flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        self._completed_color = QColor(200, 255, 200)  # Light green for completed tasks
+        self._inactive_color = QColor(128, 128, 128)  # Grey for inactive text
+        self._strikeout_font = QFont()
+        self._strikeout_font.setStrikeOut(True)
+        self._checkmark = QIcon('resources/checkmark.png')
+
+    def set_rows(self, rows):
+        """
+        Replaces all the tasks shown by the model.
+
+        Parameters:
+            rows (list): Task tuples to display.
+        """
+        # Priorities, categories and colors repeat across rows, so keep one copy of each distinct string
+        shared = {}
+        share = shared.setdefault
+        rows = [
+            (task_id, name, due_date, share(priority, priority), share(category, category), status, share(color, color))
+            for task_id, name, due_date, priority, category, status, color in rows
+        ]
+
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def task_id(self, row):
+        """
+        Returns the database ID of the task shown in a row.
+
+        Parameters:
+            row (int): The row in the model.
+
+        Returns:
+            int: The ID of the task.
+        """
+        return self._rows[row][0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        # Tasks are edited through the Edit Task dialog, never in place
+        return self._flags
+
+    def color_for(self, color):
+        """
+        Returns the QColor for a priority color string, parsing each distinct string only once.
+
+        Parameters:
+            color (str): The color string stored with the priority.
+
+        Returns:
+            QColor or None: The color, or None if the string is empty or not a valid color.
+        """
+        try:
+            return self._colors[color]
+        except KeyError:
+            qcolor = QColor(color) if color else None
+            self._colors[color] = qcolor if qcolor is not None and qcolor.isValid() else None
+            return self._colors[color]
+
+    def clear_color_cache(self):
+        # Forgets parsed priority colors, e.g. after the user's priorities have changed
+        self._colors.clear()
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == _DISPLAY_ROLE:
+            return row[column + 1]
+        # No TextAlignmentRole: the view's default alignment is already left and vertically centred
+
+        completed = row[5] == STATUS_COMPLETED
+        if role == _BACKGROUND_ROLE:
+            # The priority color takes precedence over the completed background
+            if column == self.PRIORITY_COLUMN and (color := self.color_for(row[6])) is not None:
+                return color
+            return self._completed_color if completed else None
+
+        if completed:
+            # Completed tasks are greyed out, struck through and marked with a checkmark
+            if role == _FOREGROUND_ROLE:
+                return self._inactive_color
+            if role == _FONT_ROLE:
+                return self._strikeout_font
+            if role == _DECORATION_ROLE and column == 0:
+                return self._checkmark
+        return None
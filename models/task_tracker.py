@@ -14,21 +14,23 @@ class TaskTracker(QThread):
         notify_due_tasks (pyqtSignal): A signal that is emitted when due tasks are found.
 
     Methods:
-        __init__(self, task_manager): Initializes the TaskTracker object.
+        __init__(self, task_manager, user_id): Initializes the TaskTracker object.
         run(self): Runs the task tracking process.
     """
 
     notify_due_tasks = pyqtSignal(list)
 
-    def __init__(self, task_manager: TaskManager):
+    def __init__(self, task_manager: TaskManager, user_id=None):
         """
         Initializes the TaskTracker object.
 
         Parameters:
             task_manager (TaskManager): The task manager object.
+            user_id (int, optional): ID of the user whose tasks are tracked. Defaults to None (all users).
         """
         super().__init__()
         self.task_manager = task_manager
+        self.user_id = user_id
 
     def run(self):
         """
@@ -37,7 +39,7 @@ class TaskTracker(QThread):
         while True:
             self.sleep(10) # Sleep for 10 seconds
             logging.info("Checking for due tasks...")
-            if today_tasks := self.task_manager.get_due_tasks():
+            if today_tasks := self.task_manager.get_due_tasks(self.user_id):
                 self.notify_due_tasks.emit(today_tasks)
                 logging.info(f"Found {len(today_tasks)} due tasks.")
             else:
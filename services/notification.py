@@ -78,18 +78,15 @@ class NotificationManager:
             return False
 
         try:
-            # Retrieve user preferences to check if notifications are enabled
-            preferences = self.task_manager.get_preferences(self.user_id)
-            enable_notifications = preferences.get('enable_notifications', 'True') == 'True'
-
-            if enable_notifications and self.should_send_notification(notification_id, frequency):
+            # Check the user preferences to see if notifications are enabled
+            if self.task_manager.notifications_enabled(self.user_id) and self.should_send_notification(notification_id, frequency):
 
                 # Retrieve user email to send an email notification
                 user_info = self.task_manager.get_user_data(self.user_id)
                 email = user_info['email'] if user_info else None
 
-                # Send the notification and Send an email
-                success = send_windows_notification(title, message, self.task_manager, self.user_id, timeout=timeout, app_name=app_name)
+                # Send the notification and Send an email; the preferences were checked above
+                success = send_windows_notification(title, message, self.task_manager, self.user_id, timeout=timeout, app_name=app_name, check_preferences=False)
                 if success:
                     # Update the last sent time on successful notification
                     self.update_last_sent_time(notification_id)
@@ -108,6 +105,56 @@ class NotificationManager:
             logging.error(f"Error in sending notification: {e}")
             return False
 
+    def send_notifications_bulk(self, items, frequency="daily", timeout=10, app_name=APP_NAME):
+        """Sends several notifications at once, reading user preferences and user data only once.
+
+        Args:
+            items (list[tuple[str, str, str]]): (notification_id, title, message) tuples to send.
+            frequency (str): Frequency of the notifications. Defaults to 'daily'.
+            timeout (int): Timeout for each notification. Defaults to 10.
+            app_name (str): Name of the application sending the notifications. Defaults to APP_NAME.
+
+        Returns:
+            list: The notification IDs that were successfully sent.
+        """
+        sent = []
+        try:
+            # Check the user preferences once to see if notifications are enabled
+            if not self.task_manager.notifications_enabled(self.user_id):
+                logging.info("Notifications not sent: User has disabled notifications")
+                return sent
+
+            # Keep only the notifications that are due according to their frequency
+            pending = []
+            for notification_id, title, message in items:
+                if not title or not message:
+                    logging.error("Notification title and message cannot be empty.")
+                elif self.should_send_notification(notification_id, frequency):
+                    pending.append((notification_id, title, message))
+            if not pending:
+                logging.info(f"Notifications not sent: already sent according to frequency '{frequency}'")
+                return sent
+
+            # Retrieve user email once to send the email notifications
+            user_info = self.task_manager.get_user_data(self.user_id)
+            email = user_info['email'] if user_info else None
+
+            # The preferences were checked above, so they are not read again for each notification
+            for notification_id, title, message in pending:
+                if send_windows_notification(title, message, self.task_manager, self.user_id, timeout=timeout, app_name=app_name, check_preferences=False):
+                    # Update the last sent time on successful notification
+                    self.update_last_sent_time(notification_id)
+                    if email:
+                        self.send_email(email, title, message)  # Send an email
+                    sent.append(notification_id)
+                    logging.info(f"Notification sent: {title}")
+                else:
+                    logging.warning(f"Failed to send notification: {title}")
+        except Exception as e:
+            # Log any exceptions encountered during notification sending
+            logging.error(f"Error in sending notifications: {e}")
+        return sent
+
     def connect_smtp(self) -> Tuple[smtplib.SMTP, str]:
         """
         Connects to the SMTP server using the provided credentials and returns the SMTP server object and the username.
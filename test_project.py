@@ -1,7 +1,14 @@
+import os
+import sqlite3
+import datetime
 import pytest
 from unittest.mock import MagicMock
 from project import create_user, login_user, fetch_tasks
 from models.task_manager import TaskManager
+from helpers.utils import is_valid_email, hash_password, hash_password_legacy, verify_password, is_legacy_password_hash
+from helpers.constants import PASSWORD_HASH_PREFIX, PASSWORD_HASH_ITERATIONS
+
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), 'database', 'squema.sql')
 
 # Fixture for setting up a mock TaskManager
 # Create a mock object for TaskManager.
@@ -14,6 +21,51 @@ def mock_task_manager(monkeypatch):
     monkeypatch.setattr("project.TaskManager", lambda: mock_manager)
     return mock_manager
 
+# Fixture for a real TaskManager backed by a temporary database built from the schema
+@pytest.fixture
+def task_manager(tmp_path, monkeypatch):
+    db_file = str(tmp_path / "tasks.db")
+    conn = sqlite3.connect(db_file)
+    with open(SCHEMA_FILE, encoding='utf-8') as schema:
+        # SQLite manages sqlite_sequence itself, so the statements touching it are skipped
+        statements = [s for s in schema.read().split(';') if 'sqlite_sequence' not in s]
+    conn.executescript(';'.join(statements))
+    conn.close()
+    # TaskManager validates these variables when it is created
+    monkeypatch.setenv('DATABASE_FILE', db_file)
+    monkeypatch.setenv('MAX_CONNECTION', '5')
+    monkeypatch.setenv('DEFAULT_USER', 'admin')
+    monkeypatch.setenv('DEFAULT_PASSWORD', 'Admin123!')
+    monkeypatch.delenv('ADMIN_EMAIL', raising=False)
+    return TaskManager(db_file=db_file)
+
+def insert_tasks(db_file, tasks):
+    # Insert (user_id, name, due_date, status) rows straight into the tasks table
+    with sqlite3.connect(db_file) as conn:
+        conn.executemany(
+            "INSERT INTO tasks (user_id, name, due_date, priority, category, created_at, status) VALUES (?, ?, ?, 'High', 'Work', '2024-01-01 00:00:00', ?)",
+            tasks
+        )
+    conn.close()
+
+# Fixture for a temporary database holding a few tasks to search
+@pytest.fixture
+def search_manager(task_manager):
+    insert_tasks(task_manager.db_file, [
+        (1, "Buy milk", "2024-01-06", 1),
+        (1, "Milkshake recipe", "2024-01-05", 1),
+        (1, "BUY bread", "2024-01-04", 2),
+        (1, "Pay 100% of bills", "2024-01-03", 1),
+        (1, "Rename file_name", "2024-01-02", 1),
+        (1, "Call (mom)", "2024-01-01", 1),
+        (1, "Buy eggs", "2024-01-07", 0),  # Removed task
+        (2, "Buy milk", "2024-01-08", 1),  # Another user's task
+    ])
+    return task_manager
+
+def search_names(manager, text, **options):
+    return [task[1] for task in manager.search_tasks(1, text, **options)]
+
 def test_create_user(mock_task_manager):
     # Mock the create_user method to return None (indicating success)
     mock_task_manager.create_user.return_value = None
@@ -55,3 +107,133 @@ def test_fetch_tasks_error(mock_task_manager):
     mock_task_manager.list_tasks.side_effect = Exception("Database error")
     assert fetch_tasks(3) == []
     mock_task_manager.list_tasks.assert_called_once_with(3)
+
+def test_hash_password_round_trip():
+    # A PBKDF2 hash records its iteration count and verifies with the same password and salt
+    hashed_password, salt = hash_password("Secret123!")
+    assert hashed_password.startswith(f"{PASSWORD_HASH_PREFIX}{PASSWORD_HASH_ITERATIONS}$")
+    assert verify_password("Secret123!", hashed_password, salt)
+
+def test_hash_password_other_iterations():
+    # Hashes created with another iteration count keep verifying
+    hashed_password, salt = hash_password("Secret123!", iterations=1000)
+    assert hashed_password.startswith(f"{PASSWORD_HASH_PREFIX}1000$")
+    assert verify_password("Secret123!", hashed_password, salt)
+
+def test_verify_password_wrong_password():
+    # A wrong password is rejected for both PBKDF2 and legacy hashes
+    hashed_password, salt = hash_password("Secret123!")
+    assert not verify_password("Secret123?", hashed_password, salt)
+    legacy_hash = hash_password_legacy("Secret123!", salt)
+    assert not verify_password("Secret123?", legacy_hash, salt)
+
+def test_is_legacy_password_hash():
+    hashed_password, salt = hash_password("Secret123!")
+    assert not is_legacy_password_hash(hashed_password)
+    assert is_legacy_password_hash(hash_password_legacy("Secret123!", salt))
+
+def test_verify_user_upgrades_legacy_hash(task_manager):
+    # Store a user with a hash from the former SHA-256 scheme
+    salt = "abcdef0123456789"
+    with sqlite3.connect(task_manager.db_file) as conn:
+        conn.execute(
+            "INSERT INTO users (username, password, salt, created_at) VALUES (?, ?, ?, ?)",
+            ("legacy", hash_password_legacy("Secret123!", salt), salt, "2024-01-01 00:00:00")
+        )
+    conn.close()
+
+    # A wrong password neither logs in nor upgrades the hash
+    assert task_manager.verify_user("legacy", "Secret123?") == (False, None)
+
+    success, user_id = task_manager.verify_user("legacy", "Secret123!")
+    assert success and user_id is not None
+
+    # The stored hash is now a PBKDF2 hash that still accepts the password
+    with sqlite3.connect(task_manager.db_file) as conn:
+        stored_hash, stored_salt = conn.execute("SELECT password, salt FROM users WHERE id = ?", (user_id,)).fetchone()
+    conn.close()
+    assert not is_legacy_password_hash(stored_hash)
+    assert verify_password("Secret123!", stored_hash, stored_salt)
+    assert task_manager.verify_user("legacy", "Secret123!") == (True, user_id)
+
+def test_search_tasks_like(search_manager):
+    # The default search ignores case and skips removed tasks and other users' tasks
+    assert search_names(search_manager, "buy") == ["Buy milk", "BUY bread"]
+    assert search_names(search_manager, "milk") == ["Buy milk", "Milkshake recipe"]
+
+def test_search_tasks_like_wildcards_are_literal(search_manager):
+    # '%' and '_' in the search text are matched literally rather than as LIKE wildcards
+    assert search_names(search_manager, "100%") == ["Pay 100% of bills"]
+    assert search_names(search_manager, "0% o") == ["Pay 100% of bills"]
+    assert search_names(search_manager, "file_") == ["Rename file_name"]
+    assert search_names(search_manager, "e_a") == []
+    assert search_names(search_manager, "(mom)") == ["Call (mom)"]
+
+def test_search_tasks_match_case(search_manager):
+    assert search_names(search_manager, "Buy", match_case=True) == ["Buy milk"]
+    assert search_names(search_manager, "BUY", match_case=True) == ["BUY bread"]
+    assert search_names(search_manager, "100%", match_case=True) == ["Pay 100% of bills"]
+    assert search_names(search_manager, "(mom)", match_case=True) == ["Call (mom)"]
+
+def test_search_tasks_whole_word(search_manager):
+    # Whole words match at spaces and punctuation but not inside longer words
+    assert search_names(search_manager, "milk", whole_word=True) == ["Buy milk"]
+    assert search_names(search_manager, "MILK", whole_word=True) == ["Buy milk"]
+    assert search_names(search_manager, "MILK", whole_word=True, match_case=True) == []
+    assert search_names(search_manager, "mom", whole_word=True) == ["Call (mom)"]
+    # Regex metacharacters in the text are matched literally
+    assert search_names(search_manager, "m.lk", whole_word=True) == []
+    assert search_names(search_manager, "file_name", whole_word=True) == ["Rename file_name"]
+
+def test_search_tasks_regex(search_manager):
+    assert search_names(search_manager, r"^b.y ", use_regex=True) == ["Buy milk", "BUY bread"]
+    assert search_names(search_manager, r"^B.y ", use_regex=True, match_case=True) == ["Buy milk"]
+    assert search_names(search_manager, r"\(mom\)$", use_regex=True) == ["Call (mom)"]
+    assert search_names(search_manager, r"\d+%", use_regex=True) == ["Pay 100% of bills"]
+
+def test_search_tasks_invalid_regex(search_manager):
+    # An invalid pattern returns no tasks instead of raising
+    assert search_names(search_manager, "(mom", use_regex=True) == []
+
+def test_list_tasks_order_and_status(task_manager):
+    insert_tasks(task_manager.db_file, [
+        (1, "Older", "2024-01-01", 1),
+        (1, "Newest", "2024-03-01", 2),
+        (1, "Middle", "2024-02-01", 1),
+        (1, "Removed", "2024-04-01", 0),
+        (2, "Other user", "2024-05-01", 1),
+    ])
+    # Active and completed tasks of the user, the most recent due date first
+    assert [task[1] for task in task_manager.list_tasks(1)] == ["Newest", "Middle", "Older"]
+    # Only the tasks with the requested status
+    assert [task[1] for task in task_manager.list_tasks(1, status=1)] == ["Middle", "Older"]
+    assert [task[1] for task in task_manager.list_tasks(1, status=2)] == ["Newest"]
+
+def test_get_due_tasks(task_manager):
+    today = datetime.date.today().strftime("%Y-%m-%d")
+    insert_tasks(task_manager.db_file, [
+        (1, "Due today", today, 1),
+        (1, "Due later", "2999-01-01", 1),
+        (1, "Completed today", today, 2),
+        (2, "Other user due today", today, 1),
+    ])
+    # Only the active tasks due today, as (task ID, task name) tuples
+    assert [task[1] for task in task_manager.get_due_tasks(1)] == ["Due today"]
+    assert all(isinstance(task[0], int) for task in task_manager.get_due_tasks(1))
+    # Without a user, the tasks of all users are returned
+    assert sorted(task[1] for task in task_manager.get_due_tasks()) == ["Due today", "Other user due today"]
+
+@pytest.mark.parametrize("email, valid", [
+    ("user@example.com", True),
+    ("first.last@mail.example.org", True),
+    ("userexample.com", False),  # Missing '@'
+    ("user@@example.com", False),  # Multiple '@'
+    ("user@example@example.com", False),
+    ("@example.com", False),  # Empty local part
+    ("user@example", False),  # No '.' in the domain
+    ("user@.com", False),  # Nothing before the '.'
+    ("user@example.", False),  # Nothing after the '.'
+    ("", False),
+])
+def test_is_valid_email(email, valid):
+    assert is_valid_email(email)[0] is valid
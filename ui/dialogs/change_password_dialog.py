@@ -4,7 +4,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QIcon
 from models.task_manager import TaskManager
 from services.preferences import PreferencesManager
-from helpers.utils import hash_password
+from helpers.utils import verify_password
 
 
 class ChangePasswordDialog(QDialog):
@@ -135,5 +135,4 @@ class ChangePasswordDialog(QDialog):
             return False
 
         # Hash the provided password using the retrieved salt and compare.
-        hashed_password, _ = hash_password(password, salt)
-        return hashed_password == stored_hashed_password
+        return verify_password(password, stored_hashed_password, salt)
@@ -2,11 +2,24 @@
 main_window.py: Contains the MainWindow class, which is the main interface of the application.
 It orchestrates user interactions and integrates various components like dialogs and task management functionalities.
 """
+import os
 import logging
 import markdown
-from PyQt6.QtCore import Qt, QMarginsF, QSize
-from PyQt6.QtPrintSupport import QPrintPreviewDialog, QPrinter, QPrintDialog
-from PyQt6.QtGui import QAction, QTextDocument, QPageSize, QPageLayout, QColor, QIcon
+from functools import lru_cache
+from PyQt6.QtCore import Qt, QMarginsF, QSize, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import (
+    QAction,
+    QTextDocument,
+    QTextCursor,
+    QTextTableFormat,
+    QTextFrameFormat,
+    QTextCharFormat,
+    QTextLength,
+    QFont,
+    QPageSize,
+    QPageLayout,
+    QIcon
+)
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -20,19 +33,21 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QTextEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QHeaderView,
     QMessageBox,
     QComboBox,
     QCalendarWidget,
     QDialog,
     QDialogButtonBox,
+    QProgressBar,
     QSizePolicy,
     QFileDialog
 )
 from models.task_manager import TaskManager
 from models.task_tracker import TaskTracker
+from models.task_table_model import TaskTableModel
 from .dialogs.login_dialog import LoginDialog
 from .dialogs.preferences_dialog import PreferencesDialog
 from .dialogs.edit_task_dialog import EditTaskDialog
@@ -46,8 +61,71 @@ from services.notification import NotificationManager
 from services.preferences import PreferencesManager
 from helpers.utils import show_dialog, send_windows_notification
 
-# Mapping task rows in the UI to their unique IDs in the database
-task_row_to_id = {}
+# Page setup of the printable task report
+_A4_PAGE_SIZE = QPageSize(QPageSize.PageSizeId.A4)
+_PRINT_MARGINS = QMarginsF(12, 12, 12, 12)  # Margins in millimetres
+_LANDSCAPE = QPageLayout.Orientation.Landscape
+
+# Column headers of the printable task report
+_REPORT_HEADERS = ("Name", "Due Date", "Priority", "Category")
+
+# Markdown file shown as the User Guide
+USER_GUIDE_FILE = 'README.md'
+
+
+@lru_cache(maxsize=1)
+def _markdown_renderer():
+    # Building a Markdown instance loads its extensions and compiles its patterns, so do it once
+    return markdown.Markdown()
+
+
+@lru_cache(maxsize=1)
+def _render_user_guide(mtime):
+    """
+    Read the User Guide and convert it from Markdown to HTML.
+
+    The result is cached for the given modification time, so the file is only read
+    and parsed again after it changes.
+
+    Args:
+        mtime (float): Modification time of the User Guide file.
+
+    Returns:
+        str: The User Guide as HTML.
+    """
+    with open(USER_GUIDE_FILE, 'r', encoding='utf-8') as file:
+        return _markdown_renderer().reset().convert(file.read())
+
+
+class _TaskIOSignals(QObject):
+    """
+    Signals emitted by a background task import/export job.
+    """
+    done = pyqtSignal(str)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class _TaskIORunnable(QRunnable):
+    """
+    Runs a task import/export callable on a QThreadPool worker thread.
+    """
+
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        self.signals = _TaskIOSignals()
+
+    def run(self):
+        try:
+            message = self.job()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.done.emit(message)
+        finally:
+            self.signals.finished.emit()
+
 
 class MainWindow(QMainWindow):
     """
@@ -71,7 +149,7 @@ class MainWindow(QMainWindow):
         self.app = QApplication.instance()  # Reference to the QApplication instance
         self.task_manager = task_manager
         self.notification_manager = NotificationManager(self.task_manager, user_id)
-        self.task_tracker = TaskTracker(task_manager)
+        self.task_tracker = TaskTracker(task_manager, user_id)
         self.preferences_manager = PreferencesManager(self, self.task_manager, user_id)  # Initialize PreferencesManager
 
         # Store the login dialog as an attribute
@@ -89,6 +167,24 @@ class MainWindow(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
 
+        # The menu bar is built after the window is first shown
+        self._menu_ready = False
+
+        # Background import/export jobs that are still running, and the status bar indicator shown meanwhile
+        self._task_io_runnables = set()
+        self._task_io_progress = None
+
+        # (tasks version, document) of the last rendered task report, reused until the tasks change
+        self._print_cache = (None, None)
+
+        # Priorities and categories of the user, loaded on first use and reset when one is added
+        self._priorities_cache = None
+        self._categories_cache = None
+
+        # Dialogs built the first time they are opened
+        self.date_picker_dialog = None
+        self.find_dialog = None
+
         # Setup UI components and load and apply preferences
         self.setup_ui()
         self.hide()  # Hide the main window initially
@@ -120,16 +216,6 @@ class MainWindow(QMainWindow):
         layout.addWidget(due_date_label)
         layout.addWidget(self.due_date_input)
 
-        # Setup date picker dialog
-        self.date_picker_dialog = QDialog()
-        date_picker_layout = QVBoxLayout(self.date_picker_dialog)
-        self.calendar_widget = QCalendarWidget()
-        date_picker_layout.addWidget(self.calendar_widget)
-        date_picker_button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        date_picker_button_box.accepted.connect(self.date_picker_dialog.accept)
-        date_picker_button_box.rejected.connect(self.date_picker_dialog.reject)
-        date_picker_layout.addWidget(date_picker_button_box)
-
         # Connect the date picker function to the input field's click event
         self.due_date_input.mousePressEvent = lambda event: self.show_date_picker()
 
@@ -141,8 +227,7 @@ class MainWindow(QMainWindow):
         priority_label = QLabel("Priority:")
         self.priority_combobox = QComboBox()
         # Load priorities from the TaskManager
-        priorities = self.task_manager.load_priorities(self.user_id)
-        self.priority_combobox.addItems(priorities)
+        self.priority_combobox.addItems(self._priorities())
         priority_layout.addWidget(priority_label)
         priority_layout.addWidget(self.priority_combobox)
 
@@ -151,8 +236,7 @@ class MainWindow(QMainWindow):
         self.category_combobox = QComboBox()
 
         # Load categories from the TaskManager
-        categories = self.task_manager.load_categories(self.user_id)
-        self.category_combobox.addItems(categories)
+        self.category_combobox.addItems(self._categories())
         category_layout.addWidget(category_label)
         category_layout.addWidget(self.category_combobox)
 
@@ -181,12 +265,28 @@ class MainWindow(QMainWindow):
         layout.addLayout(button_layout)
 
         # Create and set up the task table
-        self.task_table_widget = QTableWidget()
+        self.task_table_model = TaskTableModel(self)
+        self.task_table_widget = QTableView()
+        self.task_table_widget.setModel(self.task_table_model)
         self.setup_table_widget()
         layout.addWidget(self.task_table_widget)
 
-        # Update the task list to populate the table and menu
+        # Update the task list to populate the table
         self.update_task_list()
+
+    def showEvent(self, event):
+        """
+        Schedules the menu bar construction once the window has been painted for the first time.
+        """
+        super().showEvent(event)
+        if not self._menu_ready:
+            QTimer.singleShot(0, self._build_menu_once)
+
+    def _build_menu_once(self):
+        # Build the menu bar on the first event-loop tick after the window is shown.
+        if self._menu_ready:
+            return
+        self._menu_ready = True
         self.setup_menu_widget()
 
     def create_button(self, text, icon_enum, callback):
@@ -225,8 +325,21 @@ class MainWindow(QMainWindow):
         self.calendar_dialog = CalendarDialog(self.task_manager, self.user_id)
         self.calendar_dialog.exec()
 
+    def build_date_picker(self):
+        # Setup the date picker dialog; QCalendarWidget is costly, so this waits until the picker is first needed
+        self.date_picker_dialog = QDialog()
+        date_picker_layout = QVBoxLayout(self.date_picker_dialog)
+        self.calendar_widget = QCalendarWidget()
+        date_picker_layout.addWidget(self.calendar_widget)
+        date_picker_button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        date_picker_button_box.accepted.connect(self.date_picker_dialog.accept)
+        date_picker_button_box.rejected.connect(self.date_picker_dialog.reject)
+        date_picker_layout.addWidget(date_picker_button_box)
+
     def show_date_picker(self):
         # Display a date picker dialog and set the selected date as the text of the due date input field.
+        if self.date_picker_dialog is None:
+            self.build_date_picker()
         if self.date_picker_dialog.exec() == QDialog.DialogCode.Accepted:
             selected_date = self.calendar_widget.selectedDate()
             self.due_date_input.setText(
@@ -235,22 +348,25 @@ class MainWindow(QMainWindow):
     def apply_table_style(self):
         # Apply custom table styles to the task_table_widget.
         header_style = "QHeaderView::section { border-top: 1px solid grey; border-bottom: 1px solid grey; padding-left: 5px; }"
-        row_style = "QTableWidget::item { border-bottom: 1px solid grey; }"
+        row_style = "QTableView::item { border-bottom: 1px solid grey; }"
         self.task_table_widget.horizontalHeader().setStyleSheet(header_style)
         self.task_table_widget.setStyleSheet(row_style)
         self.task_table_widget.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignLeft)
 
     def setup_table_widget(self):
         # Set up the task table widget
-        self.task_table_widget.setColumnCount(4)
-        self.task_table_widget.setHorizontalHeaderLabels(["Task Name", "Due Date", "Priority", "Category"])
+        self.task_table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.task_table_widget.horizontalHeader().setStretchLastSection(True)
-        self.task_table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.task_table_widget.verticalHeader().setVisible(False)
-        self.task_table_widget.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.task_table_widget.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.task_table_widget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.task_table_widget.setSortingEnabled(False)  # Rows keep the order the database returns them in
         self.task_table_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-        # Apply the table style
+        # Set initial fixed size for 'Task Name' column
+        self.task_table_widget.setColumnWidth(0, 300)
+
+        # The table style is static, so it is applied once rather than on every refresh
         self.apply_table_style()
 
     def setup_menu_widget(self):
@@ -353,12 +469,6 @@ class MainWindow(QMainWindow):
         change_password_action.triggered.connect(self.show_change_password_dialog)
         account_submenu.addAction(change_password_action)
 
-        # Create a widget to hold the table widget and add it to the main layout
-        table_widget_container = QWidget()
-        table_widget_container.setLayout(QVBoxLayout())
-        table_widget_container.layout().addWidget(self.task_table_widget)  # Changed here
-        self.centralWidget().layout().addWidget(table_widget_container)  # Changed here
-
     def show_user_guide(self):
         """
         Display the user guide dialog with the content of the README.md file.
@@ -374,13 +484,8 @@ class MainWindow(QMainWindow):
         # Create a QTextBrowser widget to display HTML
         text_browser = QTextBrowser(dialog)
 
-        # Read the README.md file content
-        with open('README.md', 'r', encoding='utf-8') as file:
-            readme_content = file.read()
-            # Convert Markdown content to HTML
-            html_content = markdown.markdown(readme_content)
-            # Set the HTML content to the text browser
-            text_browser.setHtml(html_content)
+        # Set the README.md content, converted to HTML, to the text browser
+        text_browser.setHtml(_render_user_guide(os.path.getmtime(USER_GUIDE_FILE)))
 
         # Add the text browser to the layout
         layout.addWidget(text_browser)
@@ -472,25 +577,53 @@ class MainWindow(QMainWindow):
     def setupAndRunAddDataDialog(self, param):
         # Sets up and runs the AddDataDialog.
         dialog = AddDataDialog(self.task_manager, param, self.user_id)
-        dialog.data_added.connect(self.update_dropdowns)
+        dialog.data_added.connect(lambda: self.update_dropdowns(param))
         dialog.exec()
 
     def show_find_dialog(self):
         # Displays the Find Dialog, allowing users to search for tasks.
-        self.find_dialog = FindDialog(self.task_text_edit, self.task_manager, self.user_id)
-        self.find_dialog.search_initiated.connect(self.search_database)
+        # The dialog is created once and brought back to the front on later requests
+        if self.find_dialog is None:
+            self.find_dialog = FindDialog(self.task_text_edit, self.task_manager, self.user_id)
+            self.find_dialog.search_initiated.connect(self.search_database)
         self.find_dialog.show()
+        self.find_dialog.raise_()
+        self.find_dialog.activateWindow()
+
+    def _priorities(self):
+        # Returns the user's priorities, querying the database only when the cache is empty
+        if self._priorities_cache is None:
+            self._priorities_cache = self.task_manager.load_priorities(self.user_id)
+        return self._priorities_cache
+
+    def _categories(self):
+        # Returns the user's categories, querying the database only when the cache is empty
+        if self._categories_cache is None:
+            self._categories_cache = self.task_manager.load_categories(self.user_id)
+        return self._categories_cache
+
+    def update_dropdowns(self, data_type=None):
+        """
+        Reloads the priority and/or category dropdowns after new data was added.
 
-    def update_dropdowns(self):
-        # Refresh priority dropdown
-        self.priority_combobox.clear()
-        priorities = self.task_manager.load_priorities(self.user_id)
-        self.priority_combobox.addItems(priorities)
+        Args:
+            data_type (str, optional): 'priority' or 'category' to refresh only that dropdown.
+                Both are refreshed when omitted.
+        """
+        # Refresh priority dropdown, blocking signals while it is repopulated
+        if data_type in (None, 'priority'):
+            self._priorities_cache = None
+            self.task_table_model.clear_color_cache()
+            with QSignalBlocker(self.priority_combobox):
+                self.priority_combobox.clear()
+                self.priority_combobox.addItems(self._priorities())
 
         # Refresh category dropdown
-        self.category_combobox.clear()
-        categories = self.task_manager.load_categories(self.user_id)
-        self.category_combobox.addItems(categories)
+        if data_type in (None, 'category'):
+            self._categories_cache = None
+            with QSignalBlocker(self.category_combobox):
+                self.category_combobox.clear()
+                self.category_combobox.addItems(self._categories())
 
     def search_database(self, text, match_case, whole_word, use_regex):
         """
@@ -553,18 +686,7 @@ class MainWindow(QMainWindow):
         elif task_id is None:
             show_dialog("Task ID Error", "Failed to retrieve the task ID.", icon=QMessageBox.Icon.Critical)
         else:
-            # Add the task to the table and map it to the task ID
-            row_position = self.task_table_widget.rowCount()
-            self.task_table_widget.insertRow(row_position)
-            self.task_table_widget.setItem(row_position, 0, QTableWidgetItem(task_name))
-            self.task_table_widget.setItem(row_position, 1, QTableWidgetItem(due_date))
-            self.task_table_widget.setItem(row_position, 2, QTableWidgetItem(priority))
-            self.task_table_widget.setItem(row_position, 3, QTableWidgetItem(category))
-
-            # Update the task ID to row mapping
-            task_row_to_id[task_id] = row_position
-
-            # Refresh the task list and clear the input fields
+            # Refresh the task list to show the new task and clear the input fields
             self.update_task_list()
             self.clear_entries()
             send_windows_notification(
@@ -578,8 +700,9 @@ class MainWindow(QMainWindow):
         """
         Removes the selected tasks from the task table.
         """
-        selected_items = self.task_table_widget.selectedItems()
-        if not selected_items:
+        # One index per selected row, so each task is removed only once
+        selected_rows = {index.row() for index in self.task_table_widget.selectionModel().selectedRows()}
+        if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select a task to remove.")
             return
 
@@ -588,17 +711,14 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             return
 
-        selected_task_ids = []
+        selected_task_ids = [self.task_table_model.task_id(row) for row in sorted(selected_rows)]
 
-        for item in selected_items:
-            row = item.row()
-            task_id = task_row_to_id.get(row)
-            if task_id is not None:
-                selected_task_ids.append(task_id)
-
-        # Bulk remove tasks from database (implement this in TaskManager)
+        # Bulk remove tasks from database in a single statement
         try:
-            self.task_manager.remove_tasks(selected_task_ids)
+            error = self.task_manager.remove_tasks(selected_task_ids)
+            if error is not None:
+                QMessageBox.critical(self, "Error", f"Failed to remove tasks: {error}")
+                return
             send_windows_notification("Success", "Tasks successfully removed.", self.task_manager, self.user_id)
         except Exception as e:
             logging.error(f"An error occurred: {e}")
@@ -606,7 +726,6 @@ class MainWindow(QMainWindow):
 
         # Efficiently update the table
         self.update_task_list()
-        self.apply_table_style()
         self.clear_entries()
 
         logging.info(f"Removed tasks: {selected_task_ids}")
@@ -615,13 +734,13 @@ class MainWindow(QMainWindow):
         """
         Edit the selected task.
         """
-        selected_items = self.task_table_widget.selectedItems()
+        selected_items = self.task_table_widget.selectionModel().selectedIndexes()
         if not selected_items:
             show_dialog("No Task Selected", "Please select a task to edit.", icon=QMessageBox.Icon.Critical)
             return
 
         row = selected_items[0].row()
-        task_id = task_row_to_id.get(row)
+        task_id = self.task_table_model.task_id(row)
         if task_details := self.task_manager.get_task_details(task_id):
             self.populate_edit_dialog(task_details)
 
@@ -662,66 +781,19 @@ class MainWindow(QMainWindow):
         Returns:
             None
         """
-        # Retrieve the list of tasks using the task manager
-        if not tasks:
+        # Retrieve the list of tasks using the task manager, unless the caller supplied them
+        # (an empty search result must stay empty rather than fall back to every task)
+        if tasks is None:
             tasks = self.task_manager.list_tasks(self.user_id)
 
-        # Sort tasks by due date in descending order (most recent first)
-        tasks.sort(key=lambda task: task[2], reverse=True)
-
-        task_row_to_id.clear()
-        self.task_table_widget.setRowCount(len(tasks))
-
-        for row, task in enumerate(tasks):
-            task_id, name, due_date, priority, category, status, color = task
-
-            # Create QTableWidgetItem for each column
-            name_item = QTableWidgetItem(name)
-            due_date_item = QTableWidgetItem(due_date)
-            priority_item = QTableWidgetItem(priority)
-            category_item = QTableWidgetItem(category)
-
-            # Apply visual styles to table items
-            completed_color = QColor(200, 255, 200)  # Light green for completed tasks
-            inactive_color = QColor(128, 128, 128)  # Grey for inactive text
-            checkmark = QIcon('resources/checkmark.png')
-
-            for item in [name_item, due_date_item, priority_item, category_item]:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-                if status == 2:  # Status code for completed tasks
-                    item.setForeground(inactive_color)
-                    item.setBackground(completed_color)
-
-                    # Apply strikethrough style
-                    font = item.font()
-                    font.setStrikeOut(True)
-                    item.setFont(font)
-
-                    # Add a checkmark icon to the name item
-                    if item == name_item:
-                        item.setIcon(checkmark)
-
-                if item == priority_item and color and QColor(color).isValid():
-                    item.setBackground(QColor(color))
-
-            # Set items in the table
-            self.task_table_widget.setItem(row, 0, name_item)
-            self.task_table_widget.setItem(row, 1, due_date_item)
-            self.task_table_widget.setItem(row, 2, priority_item)
-            self.task_table_widget.setItem(row, 3, category_item)
-
-            task_row_to_id[row] = task_id
-
-        # Set initial fixed size for 'Task Name' column
-        self.task_table_widget.setColumnWidth(0, 300)
-
-        # Apply the table style after updating
-        # self.task_table_widget.resizeColumnsToContents()
-        self.task_table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.task_table_widget.horizontalHeader().setStretchLastSection(True)
-        self.apply_table_style()
+        # Hold off repainting until the whole list has been swapped in
+        self.task_table_widget.setUpdatesEnabled(False)
+        try:
+            # Tasks arrive sorted by due date in descending order (most recent first)
+            # Hand the rows, which carry their task IDs, to the table model
+            self.task_table_model.set_rows(tasks)
+        finally:
+            self.task_table_widget.setUpdatesEnabled(True)
 
     # Function to refreh the task list
     def refresh_task(self):
@@ -733,13 +805,13 @@ class MainWindow(QMainWindow):
         """
         Marks the selected task as complete after confirming with the user.
         """
-        selected_items = self.task_table_widget.selectedItems()
+        selected_items = self.task_table_widget.selectionModel().selectedIndexes()
         if not selected_items:
             QMessageBox.warning(self, "No Selection", "Please select a task to mark as complete.")
             return
 
         selected_row = selected_items[0].row()
-        task_id = task_row_to_id.get(selected_row)
+        task_id = self.task_table_model.task_id(selected_row)
 
         if task_id is not None:
             # Ask for confirmation
@@ -759,18 +831,18 @@ class MainWindow(QMainWindow):
         """
         Logs out the user, closes the session, hides the main window, and shows the login dialog.
         """
-        # Assuming self.user_id stores the user ID of the logged-in user
-        if hasattr(self, 'user_id'):
+        # self.user_id stores the user ID of the logged-in user, or None if nobody is logged in
+        user_id = self.user_id
+        if user_id is not None:
             # Log the logout event
-            logout_status = self.task_manager.log_user_activity(self.user_id, "Logout", "Success")
+            logout_status = self.task_manager.log_user_activity(user_id, "Logout", "Success")
 
             if logout_status is not None:
                 # Handle any errors in logging the logout event, if necessary
-                logging.error(f"Error logging logout: {logout_status}")
+                logging.error("Error logging logout: %s", logout_status)
 
-        # Close the session and Hide the main window
+        # Close the session; close() also hides the main window
         self.close()
-        self.hide()
 
         # Reset the login dialog for the next login
         self.login_dialog.reset_login_dialog()
@@ -781,56 +853,153 @@ class MainWindow(QMainWindow):
     def notify_due_tasks(self, tasks):
         # Notify the user about due tasks
         # This could be updating a status bar, displaying a message box, etc.
-        for task in tasks:
-            notification_id = f"task_due_{task}"  # Unique ID for each task
-            if (enable_notifications := self.notification_manager.send_notification(notification_id, "Task Due", f"Task '{task}' is due today.", frequency="hourly")):
-                logging.info(f"Notification sent for task: {task}")
+        pending_tasks = []
+        items = []
+        for task_id, task in tasks:
+            # Tasks are keyed by their database ID, which is short and unique whatever the task name
+            notification_id = f"td_{task_id}"
+            pending_tasks.append(task)
+            items.append((notification_id, "Task Due", f"Task '{task}' is due today."))
+
+        if not items:
+            return
+
+        # Send all pending notifications in a single call
+        sent = set(self.notification_manager.send_notifications_bulk(items, frequency="hourly"))
+        for task, (notification_id, _, _) in zip(pending_tasks, items):
+            if notification_id in sent:
+                logging.info("Notification sent for task: %s", task)
             else:
-                logging.info(f"Notification already sent for task: {task}")
+                logging.info("Notification already sent for task: %s", task)
+
+    def create_csv_file_dialog(self, title, accept_mode, file_mode):
+        """
+        Create a file dialog for choosing a CSV file.
+
+        The platform's native dialog is used where available. When Qt's own dialog is used
+        instead, custom directory icons and symlink resolution are skipped, since they stat
+        every entry and can stall for a long time on network mounts.
+
+        Args:
+            title (str): The window title of the dialog.
+            accept_mode (QFileDialog.AcceptMode): Whether the dialog opens or saves a file.
+            file_mode (QFileDialog.FileMode): The kind of file the user may select.
+
+        Returns:
+            QFileDialog: The configured file dialog.
+        """
+        dialog = QFileDialog(self, title, "", "CSV Files (*.csv)")
+        dialog.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
+        dialog.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+        dialog.setAcceptMode(accept_mode)
+        dialog.setFileMode(file_mode)
+        dialog.finished.connect(dialog.deleteLater)
+        return dialog
 
     def export_tasks(self):
         """
-        Export tasks to a CSV file.
+        Opens a file dialog asynchronously to choose where to export tasks as CSV.
         """
-        file_name, _ = QFileDialog.getSaveFileName(self, "Export Tasks", "", "CSV Files (*.csv)")
+        dialog = self.create_csv_file_dialog("Export Tasks", QFileDialog.AcceptMode.AcceptSave, QFileDialog.FileMode.AnyFile)
+        dialog.fileSelected.connect(self._on_export_file_chosen)
+        dialog.open()
+
+    def _on_export_file_chosen(self, file_name):
+        # Export tasks to the CSV file chosen in the export dialog on a worker thread.
         if file_name:
-            try:
-                message = self.task_manager.export_tasks(file_name, self.user_id)
-                send_windows_notification("Export Successful", message, self.task_manager, self.user_id)
+            self.run_task_io(
+                lambda: self.task_manager.export_tasks(file_name, self.user_id),
+                self._on_export_done,
+                self._on_export_error,
+            )
 
-            except Exception as e:
-                logging.error("An error occurred while exporting tasks: {e}")
+    def _on_export_done(self, message):
+        # Notify the user once the background export has finished.
+        send_windows_notification("Export Successful", message, self.task_manager, self.user_id)
+
+    def _on_export_error(self, error):
+        # Log an error raised by the background export.
+        logging.error("An error occurred while exporting tasks: %s", error)
 
     def import_tasks(self):
         """
-        Opens a file dialog to select a CSV file and imports tasks from the selected file.
-        Refreshes the task list in the UI and displays a success message if the import is successful.
-        Displays an error message if an exception occurs during the import process.
+        Opens a file dialog asynchronously to select a CSV file to import tasks from.
         """
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, "Import Tasks", "", "CSV Files (*.csv)")
+        dialog = self.create_csv_file_dialog("Import Tasks", QFileDialog.AcceptMode.AcceptOpen, QFileDialog.FileMode.ExistingFile)
+        dialog.fileSelected.connect(self._on_import_file_chosen)
+        dialog.open()
+
+    def _on_import_file_chosen(self, file_name):
+        # Import tasks from the CSV file chosen in the import dialog on a worker thread.
         if file_name:
-            try:
-                message = self.task_manager.import_tasks(file_name, self.user_id)
-                # Refresh the task list in the UI
-                self.update_task_list()
-                QMessageBox.information(self, "Import Successful", message)
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Import Failed", f"An error occurred while importing tasks: {e}")
+            self.run_task_io(
+                lambda: self.task_manager.import_tasks(file_name, self.user_id),
+                self._on_import_done,
+                self._on_import_error,
+            )
+
+    def _on_import_done(self, message):
+        """
+        Refreshes the task list in the UI and displays a success message once the background import has finished.
+        """
+        self.update_task_list()
+        QMessageBox.information(self, "Import Successful", message)
+
+    def _on_import_error(self, error):
+        # Display an error message if an exception occurs during the import process.
+        QMessageBox.critical(
+            self, "Import Failed", f"An error occurred while importing tasks: {error}")
+
+    def run_task_io(self, job, on_done, on_error):
+        """
+        Runs a task import/export job on the global thread pool so the GUI thread stays responsive.
+
+        Args:
+            job (callable): Callable performing the work and returning a status message.
+            on_done (callable): Slot receiving the status message on success.
+            on_error (callable): Slot receiving the error message if the job raises.
+        """
+        runnable = _TaskIORunnable(job)
+        runnable.signals.done.connect(on_done)
+        runnable.signals.error.connect(on_error)
+
+        # Keep the runnable (and its signal carrier) alive until the job has reported back
+        self._task_io_runnables.add(runnable)
+        runnable.signals.finished.connect(lambda: self._on_task_io_finished(runnable))
+
+        self.show_task_io_progress(True)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_task_io_finished(self, runnable):
+        # Forget a finished import/export job and hide the progress indicator once none are left.
+        self._task_io_runnables.discard(runnable)
+        if not self._task_io_runnables:
+            self.show_task_io_progress(False)
+
+    def show_task_io_progress(self, visible):
+        """
+        Shows or hides the busy indicator in the status bar while tasks are imported or exported.
+
+        Args:
+            visible (bool): Whether the indicator should be shown.
+        """
+        if self._task_io_progress is None:
+            if not visible:
+                return
+            # The number of rows is not known up front, so the bar only shows that work is in progress
+            self._task_io_progress = QProgressBar()
+            self._task_io_progress.setRange(0, 0)
+            self._task_io_progress.setMaximumWidth(150)
+            self.statusBar().addPermanentWidget(self._task_io_progress)
+        self._task_io_progress.setVisible(visible)
 
     def preview_data(self):
+        # Qt's print support module is only loaded once printing is actually used
+        from PyQt6.QtPrintSupport import QPrintPreviewDialog, QPrinter
 
-        # Create a QPrinter object
+        # Create a QPrinter object with an A4 landscape page layout and 12mm margins
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
-        printer.setPageSize(QPageSize(QPageSize.PageSizeId.A4))
-        printer.setPageOrientation(QPageLayout.Orientation.Landscape)
-
-        # Set the page margins
-        margins = QMarginsF(12, 12, 12, 12)  # Set the margins to 12mm
-        pageLayout = QPageLayout(
-            QPageSize(QPageSize.PageSizeId.A4), QPageLayout.Orientation.Landscape, margins)
-        printer.setPageLayout(pageLayout)
+        printer.setPageLayout(QPageLayout(_A4_PAGE_SIZE, _LANDSCAPE, _PRINT_MARGINS))
 
         # Create the preview dialog
         preview_dialog = QPrintPreviewDialog(printer, self)
@@ -843,49 +1012,76 @@ class MainWindow(QMainWindow):
         preview_dialog.exec()
 
     def print_preview(self, printer):
-        # This method should render the table data
-        # Prepare the document content
-        content = self.format_table_data_for_printing()
-
-        # Create a text document and set its content
-        document = QTextDocument()
-        document.setHtml(content)
-
-        # Print the document to the printer (which is connected to the preview dialog)
-        document.print(printer)
+        # Render the task report to the printer (which is connected to the preview dialog)
+        self.get_print_document().print(printer)
+
+    def get_print_document(self):
+        # Return the task report, rebuilding it only if tasks were written since it was rendered.
+        # The preview repaints on every zoom or page change, and Print reuses the previewed document.
+        version = self.task_manager.tasks_version
+        cached_version, document = self._print_cache
+        if document is None or cached_version != version:
+            document = self.build_print_document()
+            self._print_cache = (version, document)
+        return document
+
+    def build_print_document(self):
+        """
+        Build the printable task report as a QTextDocument.
 
-    def format_table_data_for_printing(self):
-        # Retrieve the list of tasks using the task manager
-        tasks = self.task_manager.list_tasks(self.user_id)
+        Tasks are streamed from the database in batches; the table grows by one batch of rows
+        at a time and is filled cell by cell through a QTextCursor, so the report never goes
+        through Qt's HTML parser.
 
-        formatted_data = "<html><head><style>" + "body {margin: 0; padding: 0;}"
-        formatted_data += "table {width: 100%; table-layout: fixed; border-collapse: collapse;}"
-        formatted_data += "th, td {border: 1px solid black; padding: 5px; text-align: left;}"
-        formatted_data += "@page{size: A4 landscape;margin: 12mm 12mm 12mm 12mm;}"
-        formatted_data += "</style></head><body>"
-        formatted_data += "<table>"  # Start the table
+        Returns:
+            QTextDocument: The document containing the tasks table.
+        """
+        document = QTextDocument()
+        cursor = QTextCursor(document)
+
+        # Full-width table with collapsed 1px solid borders and 5px cell padding
+        table_format = QTextTableFormat()
+        table_format.setBorder(1)
+        table_format.setBorderStyle(QTextFrameFormat.BorderStyle.BorderStyle_Solid)
+        table_format.setBorderCollapse(True)
+        table_format.setCellSpacing(0)
+        table_format.setCellPadding(5)
+        table_format.setWidth(QTextLength(QTextLength.Type.PercentageLength, 100))
+        table = cursor.insertTable(1, len(_REPORT_HEADERS), table_format)
+        next_cell = QTextCursor.MoveOperation.NextCell
 
         # Add table header
-        formatted_data += "<tr><th>Name</th><th>Due Date</th><th>Priority</th><th>Category</th></tr>"
-
-        # Loop through the tasks and create HTML table rows
-        for task in tasks:
-            if task:  # Assuming the first element indicates an 'Active' status
-                formatted_data += "<tr>"
-                formatted_data += f"<td>{task[1]}</td>"  # Task Name
-                formatted_data += f"<td>{task[2]}</td>"  # Due Date
-                formatted_data += f"<td>{task[3]}</td>"  # Priority
-                formatted_data += f"<td>{task[4]}</td>"  # Category
-                formatted_data += "</tr>"
-
-        # Close the table and HTML tags
-        formatted_data += "</table></body></html>"
-
-        # Return the HTML formatted data for all active tasks
-        return formatted_data
+        header_format = QTextCharFormat()
+        header_format.setFontWeight(QFont.Weight.Bold)
+        for header in _REPORT_HEADERS:
+            cursor.insertText(header, header_format)
+            cursor.movePosition(next_cell)
+
+        for tasks in self.task_manager.iter_tasks_for_print(self.user_id):
+            # Add the rows of this batch and start writing at the first of them
+            first_row = table.rows()
+            table.appendRows(len(tasks))
+            cursor = table.cellAt(first_row, 0).firstCursorPosition()
+
+            # Fill one row per task with a straight-line body specialised to the four report columns
+            insert_text = cursor.insertText
+            move_position = cursor.movePosition
+            for name, due_date, priority, category in tasks:
+                insert_text(str(name))
+                move_position(next_cell)
+                insert_text(str(due_date))
+                move_position(next_cell)
+                insert_text(str(priority))
+                move_position(next_cell)
+                insert_text(str(category))
+                move_position(next_cell)
+
+        return document
 
     def print_data(self):
         # This slot is called when the Print action is triggered
+        from PyQt6.QtPrintSupport import QPrintDialog, QPrinter
+
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
         print_dialog = QPrintDialog(printer, self)
 